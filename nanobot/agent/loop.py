@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import re
 import weakref
 from contextlib import AsyncExitStack
@@ -26,11 +25,21 @@ from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.providers.base import LLMProvider
 from nanobot.session.manager import Session, SessionManager
+from nanobot.utils.helpers import json_dumps
 
 if TYPE_CHECKING:
     from nanobot.config.schema import ChannelsConfig, ExecToolConfig
     from nanobot.cron.service import CronService
 
+_HELP_TEXT = (
+    "🐈 nanobot commands:\n"
+    "/new — Start a new conversation\n"
+    "/stop — Stop the current task\n"
+    "/help — Show available commands"
+)
+_NEW_SESSION_TEXT = "New session started."
+_ARCHIVAL_FAILED_TEXT = "Memory archival failed, session not cleared. Please try again."
+
 
 class AgentLoop:
     """
@@ -200,33 +209,36 @@ class AgentLoop:
                 reasoning_effort=self.reasoning_effort,
             )
 
-            if response.has_tool_calls:
+            tool_calls = response.tool_calls
+            reasoning = response.reasoning_content
+            if tool_calls:
                 if on_progress:
                     thought = self._strip_think(response.content)
                     if thought:
                         await on_progress(thought)
-                    await on_progress(self._tool_hint(response.tool_calls), tool_hint=True)
+                    await on_progress(self._tool_hint(tool_calls), tool_hint=True)
 
+                # Serialize each call's arguments once; reused for the message and the log line.
+                args_json = [json_dumps(tc.arguments) for tc in tool_calls]
                 tool_call_dicts = [
                     {
                         "id": tc.id,
                         "type": "function",
                         "function": {
                             "name": tc.name,
-                            "arguments": json.dumps(tc.arguments, ensure_ascii=False)
+                            "arguments": args_str
                         }
                     }
-                    for tc in response.tool_calls
+                    for tc, args_str in zip(tool_calls, args_json)
                 ]
                 messages = self.context.add_assistant_message(
                     messages, response.content, tool_call_dicts,
-                    reasoning_content=response.reasoning_content,
+                    reasoning_content=reasoning,
                     thinking_blocks=response.thinking_blocks,
                 )
 
-                for tool_call in response.tool_calls:
+                for tool_call, args_str in zip(tool_calls, args_json):
                     tools_used.append(tool_call.name)
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
                     logger.info("Tool call: {}({})", tool_call.name, args_str[:200])
                     result = await self.tools.execute(tool_call.name, tool_call.arguments)
                     messages = self.context.add_tool_result(
@@ -241,7 +253,7 @@ class AgentLoop:
                     final_content = clean or "Sorry, I encountered an error calling the AI model."
                     break
                 messages = self.context.add_assistant_message(
-                    messages, clean, reasoning_content=response.reasoning_content,
+                    messages, clean, reasoning_content=reasoning,
                     thinking_blocks=response.thinking_blocks,
                 )
                 final_content = clean
@@ -273,7 +285,14 @@ class AgentLoop:
             else:
                 task = asyncio.create_task(self._dispatch(msg))
                 self._active_tasks.setdefault(msg.session_key, []).append(task)
-                task.add_done_callback(lambda t, k=msg.session_key: self._active_tasks.get(k, []) and self._active_tasks[k].remove(t) if t in self._active_tasks.get(k, []) else None)
+                task.add_done_callback(lambda t, k=msg.session_key: self._forget_task(k, t))
+
+    def _forget_task(self, session_key: str, task: asyncio.Task) -> None:
+        """Drop a finished task, and its session entry once no tasks remain."""
+        if (tasks := self._active_tasks.get(session_key)) and task in tasks:
+            tasks.remove(task)
+            if not tasks:
+                del self._active_tasks[session_key]
 
     async def _handle_stop(self, msg: InboundMessage) -> None:
         """Cancel all active tasks and subagents for the session."""
@@ -366,20 +385,20 @@ class AgentLoop:
             self._consolidating.add(session.key)
             try:
                 async with lock:
+                    # The slice is already a fresh list; hand it over without another copy.
                     snapshot = session.messages[session.last_consolidated:]
                     if snapshot:
-                        temp = Session(key=session.key)
-                        temp.messages = list(snapshot)
+                        temp = Session(key=session.key, messages=snapshot)
                         if not await self._consolidate_memory(temp, archive_all=True):
                             return OutboundMessage(
                                 channel=msg.channel, chat_id=msg.chat_id,
-                                content="Memory archival failed, session not cleared. Please try again.",
+                                content=_ARCHIVAL_FAILED_TEXT,
                             )
             except Exception:
                 logger.exception("/new archival failed for {}", session.key)
                 return OutboundMessage(
                     channel=msg.channel, chat_id=msg.chat_id,
-                    content="Memory archival failed, session not cleared. Please try again.",
+                    content=_ARCHIVAL_FAILED_TEXT,
                 )
             finally:
                 self._consolidating.discard(session.key)
@@ -388,10 +407,10 @@ class AgentLoop:
             self.sessions.save(session)
             self.sessions.invalidate(session.key)
             return OutboundMessage(channel=msg.channel, chat_id=msg.chat_id,
-                                  content="New session started.")
+                                  content=_NEW_SESSION_TEXT)
         if cmd == "/help":
             return OutboundMessage(channel=msg.channel, chat_id=msg.chat_id,
-                                  content="🐈 nanobot commands:\n/new — Start a new conversation\n/stop — Stop the current task\n/help — Show available commands")
+                                  content=_HELP_TEXT)
 
         unconsolidated = len(session.messages) - session.last_consolidated
         if (unconsolidated >= self.memory_window and session.key not in self._consolidating):
@@ -425,6 +444,12 @@ class AgentLoop:
         )
 
         async def _bus_progress(content: str, *, tool_hint: bool = False) -> None:
+            # Skip events the channel config would filter out anyway (see ChannelManager).
+            ch = self.channels_config
+            if ch and tool_hint and not ch.send_tool_hints:
+                return
+            if ch and not tool_hint and not ch.send_progress:
+                return
             meta = dict(msg.metadata or {})
             meta["_progress"] = True
             meta["_tool_hint"] = tool_hint
@@ -455,6 +480,8 @@ class AgentLoop:
     def _save_turn(self, session: Session, messages: list[dict], skip: int) -> None:
         """Save new-turn messages into session, truncating large tool results."""
         from datetime import datetime
+        now = datetime.now()
+        stamp = now.isoformat()  # one timestamp for the whole turn
         for m in messages[skip:]:
             entry = dict(m)
             role, content = entry.get("role"), entry.get("content")
@@ -483,9 +510,9 @@ class AgentLoop:
                     if not filtered:
                         continue
                     entry["content"] = filtered
-            entry.setdefault("timestamp", datetime.now().isoformat())
+            entry.setdefault("timestamp", stamp)
             session.messages.append(entry)
-        session.updated_at = datetime.now()
+        session.updated_at = now
 
     async def _consolidate_memory(self, session, archive_all: bool = False) -> bool:
         """Delegate to MemoryStore.consolidate(). Returns True on success."""
@@ -1,7 +1,6 @@
 """Subagent manager for background task execution."""
 
 import asyncio
-import json
 import uuid
 from pathlib import Path
 from typing import Any
@@ -16,6 +15,7 @@ from nanobot.bus.events import InboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.config.schema import ExecToolConfig
 from nanobot.providers.base import LLMProvider
+from nanobot.utils.helpers import json_dumps
 
 
 class SubagentManager:
@@ -134,16 +134,17 @@ class SubagentManager:
 
                 if response.has_tool_calls:
                     # Add assistant message with tool calls
+                    args_json = [json_dumps(tc.arguments) for tc in response.tool_calls]
                     tool_call_dicts = [
                         {
                             "id": tc.id,
                             "type": "function",
                             "function": {
                                 "name": tc.name,
-                                "arguments": json.dumps(tc.arguments, ensure_ascii=False),
+                                "arguments": args_str,
                             },
                         }
-                        for tc in response.tool_calls
+                        for tc, args_str in zip(response.tool_calls, args_json)
                     ]
                     messages.append({
                         "role": "assistant",
@@ -152,8 +153,7 @@ class SubagentManager:
                     })
 
                     # Execute tools
-                    for tool_call in response.tool_calls:
-                        args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
+                    for tool_call, args_str in zip(response.tool_calls, args_json):
                         logger.debug("Subagent [{}] executing: {} with arguments: {}", task_id, tool_call.name, args_str)
                         result = await tools.execute(tool_call.name, tool_call.arguments)
                         messages.append({
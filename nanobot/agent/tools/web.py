@@ -11,6 +11,7 @@ import httpx
 from loguru import logger
 
 from nanobot.agent.tools.base import Tool
+from nanobot.utils.helpers import json_dumps
 
 # Shared constants
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_7_2) AppleWebKit/537.36"
@@ -131,7 +132,7 @@ class WebFetchTool(Tool):
         max_chars = maxChars or self.max_chars
         is_valid, error_msg = _validate_url(url)
         if not is_valid:
-            return json.dumps({"error": f"URL validation failed: {error_msg}", "url": url}, ensure_ascii=False)
+            return json_dumps({"error": f"URL validation failed: {error_msg}", "url": url})
 
         try:
             logger.debug("WebFetch: {}", "proxy enabled" if self.proxy else "direct connection")
@@ -159,14 +160,14 @@ class WebFetchTool(Tool):
             truncated = len(text) > max_chars
             if truncated: text = text[:max_chars]
 
-            return json.dumps({"url": url, "finalUrl": str(r.url), "status": r.status_code,
-                              "extractor": extractor, "truncated": truncated, "length": len(text), "text": text}, ensure_ascii=False)
+            return json_dumps({"url": url, "finalUrl": str(r.url), "status": r.status_code,
+                               "extractor": extractor, "truncated": truncated, "length": len(text), "text": text})
         except httpx.ProxyError as e:
             logger.error("WebFetch proxy error for {}: {}", url, e)
-            return json.dumps({"error": f"Proxy error: {e}", "url": url}, ensure_ascii=False)
+            return json_dumps({"error": f"Proxy error: {e}", "url": url})
         except Exception as e:
             logger.error("WebFetch error for {}: {}", url, e)
-            return json.dumps({"error": str(e), "url": url}, ensure_ascii=False)
+            return json_dumps({"error": str(e), "url": url})
 
     def _to_markdown(self, html: str) -> str:
         """Convert HTML to markdown."""
@@ -2,6 +2,8 @@
 
 import asyncio
 
+from loguru import logger
+
 from nanobot.bus.events import InboundMessage, OutboundMessage
 
 
@@ -13,9 +15,14 @@ class MessageBus:
     them and pushes responses to the outbound queue.
     """
 
-    def __init__(self):
+    def __init__(self, max_outbound_backlog: int = 256):
         self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
         self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
+        # Progress/tool-hint events are dropped once this many outbound messages are
+        # waiting, so a stalled channel can't grow the queue without bound. Replies
+        # are never dropped.
+        self.max_outbound_backlog = max_outbound_backlog
+        self._dropping_progress = False
 
     async def publish_inbound(self, msg: InboundMessage) -> None:
         """Publish a message from a channel to the agent."""
@@ -27,12 +34,30 @@ class MessageBus:
 
     async def publish_outbound(self, msg: OutboundMessage) -> None:
         """Publish a response from the agent to channels."""
+        if msg.metadata.get("_progress") and self.outbound.qsize() >= self.max_outbound_backlog:
+            if not self._dropping_progress:
+                self._dropping_progress = True
+                logger.warning(
+                    "Outbound backlog reached {}; dropping progress messages until it drains",
+                    self.max_outbound_backlog,
+                )
+            return
+        self._dropping_progress = False
         await self.outbound.put(msg)
 
     async def consume_outbound(self) -> OutboundMessage:
         """Consume the next outbound message (blocks until available)."""
         return await self.outbound.get()
 
+    def drain_outbound(self) -> list[OutboundMessage]:
+        """Take every outbound message that is already queued, without waiting."""
+        drained: list[OutboundMessage] = []
+        while True:
+            try:
+                drained.append(self.outbound.get_nowait())
+            except asyncio.QueueEmpty:
+                return drained
+
     @property
     def inbound_size(self) -> int:
         """Number of pending inbound messages."""
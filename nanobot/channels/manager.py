@@ -216,26 +216,33 @@ class ChannelManager:
                     timeout=1.0
                 )
 
-                if msg.metadata.get("_progress"):
-                    if msg.metadata.get("_tool_hint") and not self.config.channels.send_tool_hints:
-                        continue
-                    if not msg.metadata.get("_tool_hint") and not self.config.channels.send_progress:
-                        continue
-
-                channel = self.channels.get(msg.channel)
-                if channel:
-                    try:
-                        await channel.send(msg)
-                    except Exception as e:
-                        logger.error("Error sending to {}: {}", msg.channel, e)
-                else:
-                    logger.warning("Unknown channel: {}", msg.channel)
+                # Progress and tool-hint events arrive in bursts; handle everything
+                # already queued in this wakeup instead of one wait_for() per message.
+                for pending in (msg, *self.bus.drain_outbound()):
+                    await self._send_outbound(pending)
 
             except asyncio.TimeoutError:
                 continue
             except asyncio.CancelledError:
                 break
 
+    async def _send_outbound(self, msg: OutboundMessage) -> None:
+        """Filter a single outbound message and hand it to its channel."""
+        if msg.metadata.get("_progress"):
+            if msg.metadata.get("_tool_hint") and not self.config.channels.send_tool_hints:
+                return
+            if not msg.metadata.get("_tool_hint") and not self.config.channels.send_progress:
+                return
+
+        channel = self.channels.get(msg.channel)
+        if channel:
+            try:
+                await channel.send(msg)
+            except Exception as e:
+                logger.error("Error sending to {}: {}", msg.channel, e)
+        else:
+            logger.warning("Unknown channel: {}", msg.channel)
+
     def get_channel(self, name: str) -> BaseChannel | None:
         """Get a channel by name."""
         return self.channels.get(name)
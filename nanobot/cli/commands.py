@@ -264,6 +264,17 @@ def _make_provider(config: Config):
     )
 
 
+def _run_event_loop(main) -> None:
+    """Run a long-lived coroutine, on uvloop when the speedups extra is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+        return
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main)
+
+
 def _load_runtime_config(config: str | None = None, workspace: str | None = None) -> Config:
     """Load config and optionally override the active workspace."""
     from nanobot.config.loader import load_config, set_config_path
@@ -452,10 +463,10 @@ def gateway(
         try:
             await cron.start()
             await heartbeat.start()
-            await asyncio.gather(
-                agent.run(),
-                channels.start_all(),
-            )
+            # TaskGroup cancels the sibling if either side fails, so shutdown is deterministic.
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(agent.run())
+                tg.create_task(channels.start_all())
         except KeyboardInterrupt:
             console.print("\nShutting down...")
         finally:
@@ -465,7 +476,7 @@ def gateway(
             agent.stop()
             await channels.stop_all()
 
-    asyncio.run(run())
+    _run_event_loop(run())
 
 
 
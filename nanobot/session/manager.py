@@ -10,7 +10,7 @@ from typing import Any
 from loguru import logger
 
 from nanobot.config.paths import get_legacy_sessions_dir
-from nanobot.utils.helpers import ensure_dir, safe_filename
+from nanobot.utils.helpers import ensure_dir, json_dumps, safe_filename
 
 
 @dataclass
@@ -173,9 +173,8 @@ class SessionManager:
                 "metadata": session.metadata,
                 "last_consolidated": session.last_consolidated
             }
-            f.write(json.dumps(metadata_line, ensure_ascii=False) + "\n")
-            for msg in session.messages:
-                f.write(json.dumps(msg, ensure_ascii=False) + "\n")
+            f.write(json_dumps(metadata_line) + "\n")
+            f.writelines(json_dumps(msg) + "\n" for msg in session.messages)
 
         self._cache[session.key] = session
 
@@ -1,8 +1,15 @@
 """Utility functions for nanobot."""
 
+import json
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install nanobot-ai[speedups]
+    orjson = None
 
 
 def detect_image_mime(data: bytes) -> str | None:
@@ -29,6 +36,24 @@ def timestamp() -> str:
     return datetime.now().isoformat()
 
 
+# json.dumps() with non-default options builds a new JSONEncoder per call; bind one up front.
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize *obj* to compact JSON text, using orjson when it is installed.
+
+    Output is UTF-8 friendly (equivalent to ``ensure_ascii=False``). Values orjson
+    rejects (e.g. integers beyond 64 bits) fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return _json_encode(obj)
+
+
 _UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*]')
 
 def safe_filename(name: str) -> str:
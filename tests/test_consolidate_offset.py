@@ -169,6 +169,17 @@ class TestSessionPersistence:
         assert history[0]["content"] == "msg20"
         assert history[-1]["content"] == "msg29"
 
+    def test_unicode_roundtrip_from_disk(self, tmp_path):
+        """Test that non-ASCII content and tool args survive a fresh load from disk."""
+        session1 = Session(key="test:unicode")
+        session1.add_message("user", "héllo 🐈")
+        session1.add_message("assistant", "", tool_calls=[{"id": "t1", "arguments": {"q": "日本"}}])
+        SessionManager(Path(tmp_path)).save(session1)
+
+        session2 = SessionManager(Path(tmp_path)).get_or_create("test:unicode")
+        assert session2.messages[0]["content"] == "héllo 🐈"
+        assert session2.messages[1]["tool_calls"][0]["arguments"] == {"q": "日本"}
+
     def test_clear_resets_session(self, temp_manager):
         """Test that clear() properly resets session."""
         session = create_session_with_messages("test:clear", 10)
@@ -39,3 +39,21 @@ def test_save_turn_keeps_image_placeholder_after_runtime_strip() -> None:
         skip=0,
     )
     assert session.messages[0]["content"] == [{"type": "text", "text": "[image]"}]
+
+
+def test_save_turn_stamps_entries_with_one_turn_timestamp() -> None:
+    loop = _mk_loop()
+    session = Session(key="test:stamp")
+
+    loop._save_turn(
+        session,
+        [
+            {"role": "assistant", "content": "a"},
+            {"role": "assistant", "content": "b", "timestamp": "kept"},
+            {"role": "assistant", "content": "c"},
+        ],
+        skip=0,
+    )
+    stamps = [m["timestamp"] for m in session.messages]
+    assert stamps[1] == "kept"
+    assert stamps[0] == stamps[2] == session.updated_at.isoformat()
@@ -0,0 +1,31 @@
+import pytest
+
+from nanobot.bus.events import OutboundMessage
+from nanobot.bus.queue import MessageBus
+
+
+@pytest.mark.asyncio
+async def test_drain_outbound_returns_pending_in_order() -> None:
+    bus = MessageBus()
+    for i in range(3):
+        await bus.publish_outbound(OutboundMessage(channel="cli", chat_id="c", content=str(i)))
+
+    first = await bus.consume_outbound()
+    rest = bus.drain_outbound()
+
+    assert [first.content, *(m.content for m in rest)] == ["0", "1", "2"]
+    assert bus.outbound_size == 0
+    assert bus.drain_outbound() == []
+
+
+@pytest.mark.asyncio
+async def test_progress_dropped_when_outbound_backlog_full() -> None:
+    bus = MessageBus(max_outbound_backlog=2)
+    progress = {"_progress": True}
+    for i in range(3):
+        await bus.publish_outbound(
+            OutboundMessage(channel="cli", chat_id="c", content=f"p{i}", metadata=dict(progress))
+        )
+    await bus.publish_outbound(OutboundMessage(channel="cli", chat_id="c", content="reply"))
+
+    assert [m.content for m in bus.drain_outbound()] == ["p0", "p1", "reply"]
@@ -115,6 +115,26 @@ class TestMessageToolSuppressLogic:
             ('read_file("foo.txt")', True),
         ]
 
+    async def test_bus_progress_skips_events_disabled_by_channel_config(self, tmp_path: Path) -> None:
+        from nanobot.config.schema import ChannelsConfig
+
+        loop = _make_loop(tmp_path)
+        loop.channels_config = ChannelsConfig(send_progress=True, send_tool_hints=False)
+        tool_call = ToolCallRequest(id="call1", name="read_file", arguments={"path": "foo.txt"})
+        calls = iter([
+            LLMResponse(content="Looking", tool_calls=[tool_call]),
+            LLMResponse(content="Done", tool_calls=[]),
+        ])
+        loop.provider.chat = AsyncMock(side_effect=lambda *a, **kw: next(calls))
+        loop.tools.get_definitions = MagicMock(return_value=[])
+        loop.tools.execute = AsyncMock(return_value="ok")
+
+        msg = InboundMessage(channel="feishu", sender_id="user1", chat_id="chat123", content="Hi")
+        await loop._process_message(msg)
+
+        published = loop.bus.drain_outbound()
+        assert [(m.content, m.metadata["_tool_hint"]) for m in published] == [("Looking", False)]
+
 
 class TestMessageToolTurnTracking:
 
@@ -125,6 +125,20 @@ class TestDispatch:
         await asyncio.gather(t1, t2)
         assert order == ["start-a", "end-a", "start-b", "end-b"]
 
+    @pytest.mark.asyncio
+    async def test_finished_tasks_release_session_entry(self):
+        loop, _bus = _make_loop()
+
+        t1 = asyncio.create_task(asyncio.sleep(0))
+        t2 = asyncio.create_task(asyncio.sleep(0))
+        loop._active_tasks["test:c1"] = [t1, t2]
+        for t in (t1, t2):
+            t.add_done_callback(lambda t: loop._forget_task("test:c1", t))
+
+        await asyncio.gather(t1, t2)
+        await asyncio.sleep(0)
+        assert "test:c1" not in loop._active_tasks
+
 
 class TestSubagentCancellation:
     @pytest.mark.asyncio
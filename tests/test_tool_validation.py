@@ -89,6 +89,19 @@ async def test_registry_returns_validation_error() -> None:
     assert "Invalid parameters" in result
 
 
+def test_registry_definitions_cached_until_tools_change() -> None:
+    reg = ToolRegistry()
+    reg.register(SampleTool())
+    first = reg.get_definitions()
+    assert reg.get_definitions() is first
+
+    reg.register(CastTestTool({"type": "object", "properties": {}}))
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample", "cast_test"]
+
+    reg.unregister("cast_test")
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample"]
+
+
 def test_exec_extract_absolute_paths_keeps_full_windows_path() -> None:
     cmd = r"type C:\user\workspace\txt"
     paths = ExecTool._extract_absolute_paths(cmd)